@@ -0,0 +1,896 @@
+"""
+AI Ethics Advisor - Predictive Policing Domain
+
+Rule engine: propositional variables, violations and the advisor functions.
+The scenarios and the report printing live in main.py.
+
+-----------------------------------------------
+
+Propositional Variables:
+
+
+    (General)
+
+    1- sH : causes_severe_harm
+    2- mH : causes_minor_harm
+    3- PC : prevents_catastrophe
+    4- VP : violates_privacy
+    5- HC : has_consent
+    6- DH: deceives_human
+    7- EA: has_ethics_approval
+    8- EX: has_explanation
+    9- PM: prevents_minor_harm
+
+    (specific)
+
+    1- HD: uses_historical_data
+    2- BM: has_bias_mitigation
+
+-------------------------------
+
+Violations:
+
+
+    V1 (Non-Maleficence Violation):
+    V1 := sH
+
+    V2 (Harm-Mitigation Violation):
+    V2 := mH ∧ ¬PC
+
+    V3 (Data-Stewardship Violation):
+    V3 := VP ∧ ¬HC
+
+    V4 (Honesty Violation):
+    V4 := DH ∧ ¬(PM ∧ EA)
+
+    V5 (Accountability Violation):
+        V5 := ¬EX
+
+    V6 (Bias Governance Violation - Predictive Policing):
+        V6 := HD ∧ ¬BM
+
+---------------------------------------------------------
+
+Overall permissibility:
+
+    P := ¬(V1 v V2 v V3 v V4 v V5 v V6)
+
+    Using De Morgan:
+
+    P ≡ ¬V1 ∧ ¬V2 ∧ ¬V3 ∧ ¬V4 ∧ ¬V5 ∧ ¬V6
+
+
+"""
+
+from enum import IntFlag
+from functools import lru_cache, reduce
+from itertools import combinations
+from operator import itemgetter, or_
+from typing import Callable, Dict, Iterable, List, Mapping, NamedTuple, Sequence, Tuple, Union
+
+__all__ = (
+    "Action",
+    "ActionLike",
+    "HotAdvisor",
+    "PERMISSIBLE_TABLE",
+    "RULES",
+    "RULE_NAMES",
+    "RULE_ORDER",
+    "VIOLATIONS_LUT",
+    "Violation",
+    "batch_permissible",
+    "batch_permissible_u8",
+    "check",
+    "check_mask",
+    "dicts_to_soa",
+    "eval_all",
+    "evaluate",
+    "evaluate_batch",
+    "evaluate_sweep",
+    "explain",
+    "explain_population",
+    "is_action_permissible",
+    "is_permissible",
+    "is_permissible_fast",
+    "is_rule1_violated",
+    "is_rule2_violated",
+    "is_rule3_violated",
+    "is_rule4_violated",
+    "is_rule5_violated",
+    "is_rule6_violated",
+    "names",
+    "pack",
+    "permissible_bitplanes",
+    "permissible_kernel",
+    "score_population",
+    "violations_mask",
+)
+
+
+# =======================
+# Bitmask encoding
+# =======================
+
+# One bit per propositional variable (same order as the list above).
+SH = 1 << 0   # causes_severe_harm
+MH = 1 << 1   # causes_minor_harm
+PC = 1 << 2   # prevents_catastrophe
+VP = 1 << 3   # violates_privacy
+HC = 1 << 4   # has_consent
+DH = 1 << 5   # deceives_human
+EA = 1 << 6   # has_ethics_approval
+EX = 1 << 7   # has_explanation
+PM = 1 << 8   # prevents_minor_harm
+HD = 1 << 9   # uses_historical_data
+BM = 1 << 10  # has_bias_mitigation
+
+ALL = (1 << 11) - 1
+
+
+class Action(NamedTuple):
+    """
+    One AI action as its 11 propositions (fields in bit order).
+
+    Dicts keyed by the same names are still accepted everywhere an action
+    is expected; Action.from_dict converts one explicitly.
+    """
+
+    causes_severe_harm: bool
+    causes_minor_harm: bool
+    prevents_catastrophe: bool
+    violates_privacy: bool
+    has_consent: bool
+    deceives_human: bool
+    has_ethics_approval: bool
+    has_explanation: bool
+    prevents_minor_harm: bool
+    uses_historical_data: bool
+    has_bias_mitigation: bool
+
+    @classmethod
+    def from_dict(cls, action: Mapping[str, bool]) -> "Action":
+        return cls._make(_GET(action))
+
+
+# Anything the advisor accepts as an action.
+ActionLike = Union[Action, Mapping[str, bool]]
+
+# All 11 propositions of a dict action in one C-level call, in bit order.
+_KEYS = Action._fields
+_GET = itemgetter(*_KEYS)
+_BIT_OF = {key: 1 << i for i, key in enumerate(_KEYS)}
+
+
+def _values(action: ActionLike) -> Tuple[bool, ...]:
+    return action if isinstance(action, Action) else _GET(action)
+
+
+# Each rule as a clause over the packed bits: (pos, neg, name).
+# A clause fires when every proposition in `pos` holds and, unless `neg`
+# is empty, not every proposition in `neg` holds:
+#
+#     V := ∧pos ∧ ¬(∧neg)
+#
+# Everything below (names, Violation flags, lookup tables, generated
+# checks, batch kernels) is derived from this table, so a new rule is one
+# more row here plus its index in RULE_ORDER. Only evaluate() and the
+# is_ruleN_violated helpers are written out per rule.
+RULES: Tuple[Tuple[int, int, str], ...] = (
+    # V1 := sH
+    (SH, 0, "Rule 1: Non-Maleficence (Severe Harm)"),
+    # V2 := mH ∧ ¬PC
+    (MH, PC, "Rule 2: Harm-Mitigation (Unjustified Minor Harm)"),
+    # V3 := VP ∧ ¬HC
+    (VP, HC, "Rule 3: Data-Stewardship (Privacy without Consent)"),
+    # V4 := DH ∧ ¬(PM ∧ EA)
+    (DH, PM | EA, "Rule 4: Honesty (Unjustified Deception)"),
+    # V5 := ¬EX
+    (0, EX, "Rule 5: Accountability (No Explanation / Traceability)"),
+    # V6 := HD ∧ ¬BM
+    (HD, BM, "Rule 6: Bias Governance (Unmitigated Historical Bias)"),
+)
+
+# Bit i of a violation mask is set when Rule (i + 1) is violated.
+RULE_NAMES: Tuple[str, ...] = tuple(name for _, _, name in RULES)
+
+# Shared "no violations" result.
+_EMPTY: Tuple[str, ...] = ()
+
+
+# Violated rules as flags R1, R2, ... (same bit layout as RULE_NAMES).
+Violation = IntFlag(
+    "Violation",
+    [(f"R{i + 1}", 1 << i) for i in range(len(RULES))],
+    module=__name__,
+)
+
+# Every possible flag combination, built once: indexing this is much
+# cheaper than calling Violation(int), which goes through EnumMeta.
+_VIOLATION_OF: Tuple[Violation, ...] = tuple(Violation(i) for i in range(1 << len(RULES)))
+
+VIOLATION_NAMES: Dict[Violation, str] = dict(zip(Violation, RULE_NAMES))
+
+
+def names(v: Violation) -> List[str]:
+    """Resolve violation flags to rule names, only when they are needed."""
+    return [VIOLATION_NAMES[flag] for flag in Violation if flag & v]
+
+
+def pack(action: ActionLike) -> int:
+    """
+    Encode an action as an 11-bit int (one bit per proposition).
+    """
+    if not isinstance(action, Action):
+        return _pack_dict(action)
+    sh, mh, pc, vp, hc, dh, ea, ex, pm, hd, bm = action
+    return (
+        (SH if sh else 0) | (MH if mh else 0) | (PC if pc else 0)
+        | (VP if vp else 0) | (HC if hc else 0) | (DH if dh else 0)
+        | (EA if ea else 0) | (EX if ex else 0) | (PM if pm else 0)
+        | (HD if hd else 0) | (BM if bm else 0)
+    )
+
+
+def _codegen(src: str, name: str, **env: object) -> Callable:
+    """
+    Compile generated source and return the function it defines; `env`
+    becomes the function's globals.
+    """
+    ns: Dict[str, object] = dict(env)
+    exec(compile(src, "<ethics>", "exec"), ns)
+    return ns[name]  # type: ignore[return-value]
+
+
+# pack() for a dict action: each key is subscripted in place, without
+# building the 11-value tuple first.
+_pack_dict = _codegen(
+    "def _pack_dict(a):\n    return "
+    + " | ".join(f"({1 << i} if a[{key!r}] else 0)" for i, key in enumerate(_KEYS))
+    + "\n",
+    "_pack_dict",
+)
+
+
+def _compile_violations_mask(rules: Sequence[Tuple[int, int, str]]) -> Callable[[int], int]:
+    """
+    Generate a branchless evaluator of every clause in RULES on a packed action.
+
+    Clause i becomes `((m & pos) == pos) & ((m & neg) != neg)` shifted into
+    bit i, and the clauses are OR-ed together in a single expression.
+    """
+    terms = []
+    for i, (pos, neg, _) in enumerate(rules):
+        tests = []
+        if pos:
+            tests.append(f"((m & {pos}) == {pos})")
+        if neg:
+            tests.append(f"((m & {neg}) != {neg})")
+        terms.append(f"(({' & '.join(tests)}) << {i})")
+    src = "def _compute_violations(m):\n    return " + " | ".join(terms) + "\n"
+    return _codegen(src, "_compute_violations")
+
+
+_compute_violations = _compile_violations_mask(RULES)
+
+# The violation mask of every possible packed action. A tuple rather than
+# bytes, so the masks are not limited to 8 rules.
+VIOLATIONS_LUT: Tuple[int, ...] = tuple(_compute_violations(m) for m in range(ALL + 1))
+
+
+def violations_mask(m: int) -> int:
+    """
+    Violation mask for a packed action, bit i set <=> Rule (i + 1) is violated,
+    so m is permissible exactly when the result is 0. One table lookup.
+    """
+    return VIOLATIONS_LUT[m]
+
+
+def explain(action: ActionLike) -> List[str]:
+    """Names of the rules an action violates, via VIOLATIONS_LUT."""
+    m = VIOLATIONS_LUT[pack(action)]
+    return [name for i, name in enumerate(RULE_NAMES) if m >> i & 1]
+
+
+# Order in which the rules are tried by the short-circuiting checks
+# (any_violated, permissible_kernel): cheapest and most often violated first.
+# Tune this from observed hit rates; it never changes a result. It must
+# list every rule of RULES exactly once (checked at import).
+RULE_ORDER: Tuple[int, ...] = (4, 0, 2, 1, 5, 3)  # V5, V1, V3, V2, V6, V4
+
+
+def _to_dnf(
+    rules: Sequence[Tuple[int, int, str]],
+    order: Sequence[int],
+) -> Tuple[Tuple[int, int], ...]:
+    """
+    Simplify ¬P = V1 ∨ ... ∨ V6 into a sum of products over the packed bits.
+
+    Each term is a pair (care, value) that holds when m & care == value.
+    ¬(∧neg) is split by De Morgan into one term per negated bit, and any
+    term absorbed by a more general one is dropped. Terms keep the rule
+    order given by `order`, which must list every rule exactly once.
+    """
+    if sorted(order) != list(range(len(rules))):
+        raise ValueError(f"rule order {tuple(order)} is not a permutation of the rules")
+    terms: List[Tuple[int, int]] = []
+    for idx in order:
+        pos, neg, _ = rules[idx]
+        new = [(pos, pos)] if not neg else [
+            (pos | 1 << i, pos)
+            for i in range(neg.bit_length())
+            if neg >> i & 1 and not pos >> i & 1
+        ]
+        terms.extend(t for t in new if t not in terms)
+
+    return tuple(u for u in terms if not any(_absorbs(t, u) for t in terms))
+
+
+def _absorbs(t: Tuple[int, int], u: Tuple[int, int]) -> bool:
+    """True when term t is more general than term u (t ∨ u == t)."""
+    return t != u and (t[0] & u[0]) == t[0] and (u[1] & t[0]) == t[1]
+
+
+# Above this many non-essential primes, _minimize covers the rest greedily
+# instead of searching every subset (at most 2**12 candidate covers).
+_PETRICK_LIMIT = 12
+
+
+def _minimize(terms: Sequence[Tuple[int, int]], truth: Sequence[int]) -> Tuple[Tuple[int, int], ...]:
+    """
+    Two-level minimization of a DNF over the packed bits.
+
+    1. Iterated consensus until nothing new appears, which yields every
+       prime implicant (Blake canonical form, as in Quine–McCluskey).
+    2. Drop absorbed terms.
+    3. Cover every row of the truth table (`truth[m]` != 0 <=> the function
+       holds): take the essential primes, then search the remaining
+       primes for a smallest cover by size, as Petrick's method would.
+
+    The result has the fewest possible terms as long as at most
+    _PETRICK_LIMIT non-essential primes are left for step 3; past that the
+    rest is covered greedily (largest remaining coverage first), which is
+    irredundant but not always minimal. Terms keep the input order.
+
+    Raises ValueError if the terms and the truth table disagree.
+    """
+    for care, value in terms:
+        if any(not truth[m] for m in range(len(truth)) if (m & care) == value):
+            raise ValueError(f"term {(care, value)} holds on a row where truth is 0")
+
+    primes = list(terms)
+    changed = True
+    while changed:
+        changed = False
+        for t in list(primes):
+            for u in list(primes):
+                clash = t[0] & u[0] & (t[1] ^ u[1])
+                if clash == 0 or clash & (clash - 1):
+                    continue  # consensus needs exactly one opposed variable
+                c = ((t[0] | u[0]) & ~clash, (t[1] | u[1]) & ~clash)
+                if c not in primes and not any(_absorbs(p, c) for p in primes):
+                    primes.append(c)
+                    changed = True
+        primes = [u for u in primes if not any(_absorbs(t, u) for t in primes)]
+
+    # covers[i] has bit k set when prime i holds on the k-th true row.
+    rows = [m for m in range(len(truth)) if truth[m]]
+    covers = [
+        sum(1 << k for k, m in enumerate(rows) if (m & c) == v) for c, v in primes
+    ]
+    everything = (1 << len(rows)) - 1
+    if reduce(or_, covers, 0) != everything:
+        raise ValueError("the terms do not cover every row where truth is 1")
+
+    # A prime is essential when it alone covers some row.
+    before = [0]
+    for cover in covers:
+        before.append(before[-1] | cover)
+    after = [0]
+    for cover in reversed(covers):
+        after.append(after[-1] | cover)
+    after.reverse()
+    chosen = [
+        i for i, cover in enumerate(covers) if cover & ~(before[i] | after[i + 1])
+    ]
+
+    left = everything & ~reduce(or_, [covers[i] for i in chosen], 0)
+    rest = [i for i, cover in enumerate(covers) if i not in chosen and cover & left]
+    if len(rest) <= _PETRICK_LIMIT:
+        # Smallest first; the full `rest` always covers, so this terminates.
+        candidates = (
+            picks for size in range(len(rest) + 1) for picks in combinations(rest, size)
+        )
+        chosen.extend(next(
+            picks for picks in candidates
+            if reduce(or_, [covers[i] for i in picks], 0) & left == left
+        ))
+    else:
+        while left:
+            best = max(rest, key=lambda i: bin(covers[i] & left).count("1"))
+            chosen.append(best)
+            left &= ~covers[best]
+    return tuple(primes[i] for i in sorted(chosen))
+
+
+# Minimized ¬P, derived once from RULES at import:
+#     ¬EX ∨ sH ∨ (VP ∧ ¬HC) ∨ (mH ∧ ¬PC) ∨ (HD ∧ ¬BM) ∨ (DH ∧ ¬EA) ∨ (DH ∧ ¬PM)
+VIOLATION_DNF = _minimize(_to_dnf(RULES, RULE_ORDER), VIOLATIONS_LUT)
+
+
+# Short variable names, in bit order (as in the module docstring).
+_VARS = ("sH", "mH", "PC", "VP", "HC", "DH", "EA", "EX", "PM", "HD", "BM")
+
+
+def _operands(from_dict: bool) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Parameter list of a generated function and the expression it uses for
+    each variable: 11 plain arguments, or subscripts of one dict `a`.
+    """
+    if from_dict:
+        return "a", tuple(f"a[{key!r}]" for key in _KEYS)
+    return ", ".join(_VARS), _VARS
+
+
+def _compile_dnf(
+    dnf: Sequence[Tuple[int, int]],
+    name: str,
+    negate: bool = False,
+    from_dict: bool = False,
+) -> Callable[..., bool]:
+    """
+    Generate a straight-line Python function for a DNF over the 11 variables.
+
+    The body is one `or`-chain of `and`-terms over plain arguments, so a call
+    does no loops. With negate=True the function returns the complement
+    instead, written out by De Morgan as an `and`-chain of `or`-clauses.
+    With from_dict=True it takes one dict action and subscripts it in place,
+    so only the keys the short-circuit actually reaches are read.
+    """
+    params, operands = _operands(from_dict)
+    terms = []
+    for care, value in dnf:
+        literals = [
+            var if (value >> i & 1) != negate else f"not {var}"
+            for i, var in enumerate(operands)
+            if care >> i & 1
+        ]
+        joiner = " or " if negate else " and "
+        terms.append(literals[0] if len(literals) == 1 else f"({joiner.join(literals)})")
+    body = (" and " if negate else " or ").join(terms)
+    src = f"def {name}({params}):\n    return bool({body})\n"
+    return _codegen(src, name)
+
+
+# permissible_kernel(sH, mH, ..., BM) -> P itself, in De Morgan form:
+#     EX ∧ ¬sH ∧ (¬VP ∨ HC) ∧ (¬mH ∨ PC) ∧ (¬HD ∨ BM) ∧ (¬DH ∨ EA) ∧ (¬DH ∨ PM)
+permissible_kernel = _compile_dnf(VIOLATION_DNF, "permissible_kernel", negate=True)
+_permissible_dict = _compile_dnf(VIOLATION_DNF, "_permissible_dict", negate=True, from_dict=True)
+
+
+def _compile_breakdown(
+    rules: Sequence[Tuple[int, int, str]],
+    name: str = "_breakdown",
+    from_dict: bool = False,
+) -> Callable[..., Tuple[str, ...]]:
+    """
+    Generate one function that names every violated rule of an action.
+
+    Each clause of RULES becomes an `if` over plain arguments, e.g.
+    `if DH and not (PM and EA):` for V4, so the whole breakdown is a
+    single call with no helper calls. from_dict works as in _compile_dnf.
+    """
+    params, operands = _operands(from_dict)
+
+    def conj(bits: int) -> List[str]:
+        return [var for i, var in enumerate(operands) if bits >> i & 1]
+
+    lines = [f"def {name}({params}):", "    violated = []"]
+    for i, (pos, neg, _) in enumerate(rules):
+        tests = conj(pos)
+        if neg:
+            negated = conj(neg)
+            inner = negated[0] if len(negated) == 1 else f"({' and '.join(negated)})"
+            tests.append(f"not {inner}")
+        lines.append(f"    if {' and '.join(tests)}:")
+        lines.append(f"        violated.append(_NAMES[{i}])")
+    lines.append("    return tuple(violated) if violated else _EMPTY")
+    rule_names = tuple(name for _, _, name in rules)
+    return _codegen("\n".join(lines) + "\n", name, _NAMES=rule_names, _EMPTY=_EMPTY)
+
+
+# _breakdown(sH, mH, ..., BM) -> names of the violated rules, in rule order
+# (the shared _EMPTY when the action is permissible).
+_breakdown = _compile_breakdown(RULES)
+_breakdown_dict = _compile_breakdown(RULES, "_breakdown_dict", from_dict=True)
+
+
+def _compile_packed_dnf(dnf: Sequence[Tuple[int, int]]) -> Callable[[int], bool]:
+    """
+    Same as _compile_dnf, but over a packed action: one `(m & care) == value`
+    test per term.
+    """
+    terms = " or ".join(f"(m & {care}) == {value}" for care, value in dnf)
+    src = f"def any_violated(m):\n    return {terms}\n"
+    return _codegen(src, "any_violated")
+
+
+# any_violated(m) -> fast check of ¬P on a packed action, without the
+# per-rule breakdown.
+any_violated = _compile_packed_dnf(VIOLATION_DNF)
+
+# Only 2048 actions exist, so P is tabulated once: byte m is 1 <=> the
+# packed action m is permissible. The whole table is 2 KiB.
+PERMISSIBLE_TABLE = bytes(not any_violated(m) for m in range(ALL + 1))
+
+
+def is_permissible_fast(mask: int) -> bool:
+    """P for a packed action (see pack) as a single table lookup."""
+    return PERMISSIBLE_TABLE[mask] != 0
+
+
+def evaluate(action: ActionLike) -> Tuple[bool, bool, bool, bool, bool, bool]:
+    """
+    Evaluate V1..V6 in one pass: every proposition is read once into a
+    local, then each rule is a single `and`/`not` expression. Inputs are
+    tested for truthiness, like everywhere else, and the results are bools.
+
+    It will return : ( V1, V2, V3, V4, V5, V6)
+    """
+    sH, mH, PC, VP, HC, DH, EA, EX, PM, HD, BM = _values(action)
+    return (
+        bool(sH),
+        bool(mH) and not PC,
+        bool(VP) and not HC,
+        bool(DH) and not (PM and EA),
+        not EX,
+        bool(HD) and not BM,
+    )
+
+
+# The rule helpers read only their own one or two propositions.
+def is_rule1_violated(action: ActionLike) -> bool:
+    """
+    Rule 1 - Non-Maleficence:
+    V1 := causes_severe_harm
+    """
+    if isinstance(action, Action):
+        return bool(action.causes_severe_harm)
+    return bool(action["causes_severe_harm"])
+
+
+def is_rule2_violated(action: ActionLike) -> bool:
+    """
+    Rule 2 - Harm-Mitigation:
+    V2 := causes_minor_harm ∧ ¬prevents_catastrophe
+    """
+    if isinstance(action, Action):
+        return bool(action.causes_minor_harm) and not action.prevents_catastrophe
+    return bool(action["causes_minor_harm"]) and not action["prevents_catastrophe"]
+
+
+def is_rule3_violated(action: ActionLike) -> bool:
+    """
+    Rule 3 - Data-Stewardship:
+    V3 := violates_privacy ∧ ¬has_consent
+    """
+    if isinstance(action, Action):
+        return bool(action.violates_privacy) and not action.has_consent
+    return bool(action["violates_privacy"]) and not action["has_consent"]
+
+
+def is_rule4_violated(action: ActionLike) -> bool:
+    """
+    Rule 4 - Honesty:
+    V4 := deceives_human ∧ ¬(prevents_minor_harm ∧ has_ethics_approval)
+    """
+    if isinstance(action, Action):
+        return bool(action.deceives_human) and not (
+            action.prevents_minor_harm and action.has_ethics_approval
+        )
+    return bool(action["deceives_human"]) and not (
+        action["prevents_minor_harm"] and action["has_ethics_approval"]
+    )
+
+
+def is_rule5_violated(action: ActionLike) -> bool:
+    """
+    Rule 5 - Accountability:
+    V5 := ¬has_explanation
+    """
+    if isinstance(action, Action):
+        return not action.has_explanation
+    return not action["has_explanation"]
+
+
+def is_rule6_violated(action: ActionLike) -> bool:
+    """
+    Rule 6 - Bias Governance (Predictive Policing):
+    V6 := uses_historical_data ∧ ¬has_bias_mitigation
+    """
+    if isinstance(action, Action):
+        return bool(action.uses_historical_data) and not action.has_bias_mitigation
+    return bool(action["uses_historical_data"]) and not action["has_bias_mitigation"]
+
+
+def is_action_permissible(action: ActionLike) -> Tuple[bool, Tuple[str, ...]]:
+    """
+     
+     Main advisor function.
+
+     It will return : ( is_premissible, violated_rules)
+
+    """
+    if isinstance(action, Action):
+        violated = _breakdown(*action)
+    else:
+        violated = _breakdown_dict(action)
+    return not violated, violated
+
+
+def is_permissible(action: ActionLike) -> bool:
+    """
+    Just the verdict P, without naming the violated rules.
+
+    The check short-circuits on the first violated rule, trying them in
+    RULE_ORDER.
+    """
+    if isinstance(action, Action):
+        return permissible_kernel(*action)
+    return _permissible_dict(action)
+
+
+def check(action: ActionLike) -> Tuple[bool, Violation]:
+    """
+    Like is_action_permissible, but the violated rules come back as
+    Violation flags; use names(v) to turn them into strings.
+
+    One VIOLATIONS_LUT lookup on the packed action, with no rule names built.
+    """
+    viol = VIOLATIONS_LUT[pack(action)]
+    return viol == 0, _VIOLATION_OF[viol]
+
+
+def check_mask(m: int) -> Tuple[bool, Violation]:
+    """check() for an already packed action (see pack)."""
+    viol = VIOLATIONS_LUT[m]
+    return viol == 0, _VIOLATION_OF[viol]
+
+
+@lru_cache(maxsize=ALL + 1)  # room for every possible packed action
+def _eval_packed(m: int) -> Tuple[bool, Tuple[str, ...]]:
+    """
+    Memoized advisor for an already packed action.
+    """
+    if PERMISSIBLE_TABLE[m]:
+        return True, _EMPTY
+    viol = violations_mask(m)
+    return False, tuple(name for i, name in enumerate(RULE_NAMES) if viol >> i & 1)
+
+
+def _advise_values(values: Tuple[bool, ...]) -> Tuple[bool, Tuple[str, ...]]:
+    """
+    Uncached advisor over the 11 proposition values, in bit order.
+    """
+    violated = _breakdown(*values)
+    return not violated, violated
+
+
+class HotAdvisor:
+    """
+    Advisor that counts how often it sees each distinct action.
+
+    Every call counts its action, keyed on the tuple of its 11 values (no
+    packing); once an action has been seen `hot_threshold` times its result
+    is stored in `hot`, and later calls return it without running any rule.
+    Cold calls evaluate directly.
+
+    This is a counting wrapper, not a speedup. Building and hashing the key
+    of a dict action costs more than is_action_permissible's own single
+    generated call: a hot hit measures about 0.53 us, against 0.28-0.45 us
+    for a direct call. Use it for the per-action counts in `counts` and
+    stats(), not for speed.
+
+    It is called like is_action_permissible: ( is_premissible, violated_rules)
+    """
+
+    def __init__(self, hot_threshold: int = 1) -> None:
+        self.hot_threshold = hot_threshold
+        self.counts: Dict[Tuple[bool, ...], int] = {}
+        self.hot: Dict[Tuple[bool, ...], Tuple[bool, Tuple[str, ...]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, action: ActionLike) -> Tuple[bool, Tuple[str, ...]]:
+        key = _values(action)
+        result = self.hot.get(key)
+        if result is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            count = self.counts.get(key, 0) + 1
+            self.counts[key] = count
+            result = _advise_values(key)
+            if count >= self.hot_threshold:
+                self.hot[key] = result
+        return result
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and the number of promoted actions."""
+        return {"hits": self.hits, "misses": self.misses, "hot": len(self.hot)}
+
+
+def dicts_to_soa(actions: Sequence[ActionLike]) -> Dict[str, int]:
+    """
+    Convert actions to Structure-of-Arrays form: one int "bit-plane" per
+    proposition, whose bit j holds its value for action j.
+
+    The conversion costs more than evaluating the actions one by one, so
+    dicts_to_soa + batch_permissible is about 5x slower than a loop over
+    is_permissible (100k dicts: 0.09 s against 0.017 s). Use it to build
+    planes that are kept and scored many times, not to score dicts once.
+    """
+    rows = [_values(action) for action in actions]
+    if not rows:
+        return dict.fromkeys(_KEYS, 0)
+    # Each plane is parsed from a binary string in one C-level int() call;
+    # OR-ing 1 << j into a growing int would be quadratic in the batch size.
+    return {
+        key: int("".join(["1" if value else "0" for value in reversed(column)]), 2)
+        for key, column in zip(_KEYS, zip(*rows))
+    }
+
+
+# Each clause of RULES as the indices of its `pos` and `neg` propositions.
+_RULE_INDICES: Tuple[Tuple[Tuple[int, ...], Tuple[int, ...]], ...] = tuple(
+    (
+        tuple(i for i in range(len(_KEYS)) if pos >> i & 1),
+        tuple(i for i in range(len(_KEYS)) if neg >> i & 1),
+    )
+    for pos, neg, _ in RULES
+)
+
+
+def _any_rule_lanes(columns: Sequence[int], lanes: int) -> int:
+    """
+    OR of every clause in RULES over a whole batch at once.
+
+    columns[i] holds proposition i for every action, one lane per action,
+    and `lanes` is an all-true column. Returns the lanes of the actions
+    that violate at least one rule.
+    """
+    violated = 0
+    for pos, neg in _RULE_INDICES:
+        hit = lanes
+        for i in pos:
+            hit &= columns[i]
+        if neg:
+            held = lanes
+            for i in neg:
+                held &= columns[i]
+            hit &= ~held
+        violated |= hit
+    return violated
+
+
+def batch_permissible(flags: Mapping[str, int], n: int) -> int:
+    """
+    Overall permissibility P for a batch of n actions in SoA form.
+
+    Each rule is a few bitwise ops over the whole batch. Returns a
+    bit-plane with bit j set <=> action j is permissible.
+
+    This only pays off when the caller already holds the bit-planes (see
+    dicts_to_soa); for dict actions, loop over is_permissible instead.
+    """
+    lanes = (1 << n) - 1
+    return ~_any_rule_lanes([flags[key] for key in _KEYS], lanes) & lanes
+
+
+def batch_permissible_u8(columns: Sequence[bytes], out: bytearray) -> None:
+    """
+    Fused batch kernel over uint8 columns (one 0/1 byte per action).
+
+    `columns` holds the 11 propositions in bit order, each with len(out)
+    bytes. Every column is read as one little-endian int, so each byte is an
+    8-bit lane and every rule is a few C-level bitwise ops over the whole
+    batch. Writes 1 (permissible) or 0 per action into out.
+
+    Raises ValueError unless there are 11 columns of exactly len(out)
+    bytes, each byte 0 or 1.
+    """
+    n = len(out)
+    if len(columns) != len(_KEYS):
+        raise ValueError(f"expected {len(_KEYS)} columns, got {len(columns)}")
+    for key, column in zip(_KEYS, columns):
+        if len(column) != n:
+            raise ValueError(f"column {key!r} has {len(column)} bytes, expected {n}")
+        if bytes(column).translate(None, b"\x00\x01"):
+            raise ValueError(f"column {key!r} holds bytes other than 0 and 1")
+    ones = int.from_bytes(b"\x01" * n, "little")
+    lanes = [int.from_bytes(column, "little") for column in columns]
+    out[:] = (_any_rule_lanes(lanes, ones) ^ ones).to_bytes(n, "little")
+
+
+def evaluate_sweep(
+    base_action: ActionLike,
+    varying_keys: Sequence[str],
+    values_matrix: Iterable[Sequence[bool]],
+) -> List[int]:
+    """
+    Sensitivity sweep: re-evaluate one action while a few propositions vary.
+
+    The fixed propositions are packed once; each row of `values_matrix`
+    only supplies the values of `varying_keys` (in that order), so a row
+    costs a few ORs and one VIOLATIONS_LUT lookup.
+
+    It will return one violation mask per row (0 = permissible).
+    Raises ValueError on a repeated key or a row of the wrong length.
+    """
+    bits = [_BIT_OF[key] for key in varying_keys]
+    if len(set(bits)) != len(bits):
+        raise ValueError(f"duplicate key in varying_keys: {list(varying_keys)}")
+    base = pack(base_action) & ~reduce(or_, bits, 0)
+    masks = []
+    for row in values_matrix:
+        if len(row) != len(bits):
+            raise ValueError(f"row has {len(row)} values, expected {len(bits)}")
+        m = reduce(or_, [bit for bit, value in zip(bits, row) if value], base)
+        masks.append(VIOLATIONS_LUT[m])
+    return masks
+
+
+def permissible_bitplanes(planes: Sequence[bytes], n: int) -> bytes:
+    """
+    batch_permissible over packed bit-plane buffers.
+
+    `planes` holds the 11 propositions in bit order, each as (n + 7) // 8
+    bytes with action j at bit j % 8 of byte j // 8 (8 actions per byte).
+    Returns the permissibility bit-plane in the same layout.
+    """
+    flags = {key: int.from_bytes(plane, "little") for key, plane in zip(_KEYS, planes)}
+    return batch_permissible(flags, n).to_bytes((n + 7) // 8, "little")
+
+
+def eval_all(actions: Sequence[ActionLike]) -> List[int]:
+    """
+    Violation masks for many actions: one VIOLATIONS_LUT lookup on each
+    packed action.
+
+    It will return one violation mask per action (same layout as
+    violations_mask).
+    """
+    return [VIOLATIONS_LUT[pack(action)] for action in actions]
+
+
+def evaluate_batch(actions: Sequence[ActionLike]) -> List[Tuple[bool, Tuple[str, ...]]]:
+    """
+    Batched version of is_action_permissible.
+
+    It is just the scalar advisor in a loop: building bit-planes from dict
+    actions costs more than the per-action call it would replace.
+
+    It will return one ( is_premissible, violated_rules) pair per action.
+    """
+    return [is_action_permissible(action) for action in actions]
+
+
+def score_population(actions: Iterable[ActionLike]) -> bytes:
+    """
+    Permissibility of a whole population: 1 or 0 per action, each a single
+    PERMISSIBLE_TABLE lookup on the packed action.
+    """
+    return bytes(PERMISSIBLE_TABLE[pack(action)] for action in actions)
+
+
+def explain_population(actions: Iterable[ActionLike]) -> List[Tuple[str, ...]]:
+    """
+    Violated-rule names for every action of a population.
+
+    Populations repeat the same flag settings a lot, so each distinct
+    packed action is explained once and the result is shared by all of
+    its duplicates.
+    """
+    masks = [pack(action) for action in actions]
+    explained = {m: _eval_packed(m)[1] for m in set(masks)}
+    return [explained[m] for m in masks]
+
@@ -1,142 +1,26 @@
 """
 AI Ethics Advisor - Predictive Policing Domain
 
------------------------------------------------
-
-Propositional Variables:
-
-
-    (General)
-
-    1- sH : causes_severe_harm
-    2- mH : causes_minor_harm
-    3- PC : prevents_catastrophe
-    4- VP : violates_privacy
-    5- HC : has_consent
-    6- DH: deceives_human
-    7- EA: has_ethics_approval
-    8- EX: has_explanation
-    9- PM: prevents_minor_harm
-
-    (specific)
-
-    1- HD: uses_historical_data
-    2- BM: has_bias_mitigation
-
--------------------------------
-
-Violations:
-
-
-    V1 (Non-Maleficence Violation):
-    V1 := sH
-
-    V2 (Harm-Mitigation Violation):
-    V2 := mH ∧ ¬PC
-
-    V3 (Data-Stewardship Violation):
-    V3 := VP ∧ ¬HC
-
-    V4 (Honesty Violation):
-    V4 := DH ∧ ¬(PM ∧ EA)
-
-    V5 (Accountability Violation):
-        V5 := ¬EX
-
-    V6 (Bias Governance Violation - Predictive Policing):
-        V6 := HD ∧ ¬BM
-
----------------------------------------------------------
-
-Overall permissibility:
-
-    P := ¬(V1 v V2 v V3 v V4 v V5 v V6)
-
-    Using De Morgan:
-
-    P ≡ ¬V1 ∧ ¬V2 ∧ ¬V3 ∧ ¬V4 ∧ ¬V5 ∧ ¬V6
-
-
+Entry point: the three test scenarios and their printed reports.
+The rules themselves are implemented in advisor.py.
 """
 
-from typing import Dict, List, Tuple
-
-
-def is_rule1_violated(action: Dict[str, bool]) -> bool:
-    """
-    Rule 1 - Non-Maleficence:
-    V1 := causes_severe_harm
-    """
-    return action["causes_severe_harm"]
-
+import sys
+from functools import cache
+from pathlib import Path
+from typing import Dict, Tuple
 
-def is_rule2_violated(action: Dict[str, bool]) -> bool:
-    """
-    Rule 2 - Harm-Mitigation:
-    V2 := causes_minor_harm ∧ ¬prevents_catastrophe
-    """
-    return action["causes_minor_harm"] and not action["prevents_catastrophe"]
+from advisor import Action, Violation, check_mask, names, pack
 
-
-def is_rule3_violated(action: Dict[str, bool]) -> bool:
-    """
-    Rule 3 - Data-Stewardship:
-    V3 := violates_privacy ∧ ¬has_consent
-    """
-    return action["violates_privacy"] and not action["has_consent"]
-
-
-def is_rule4_violated(action: Dict[str, bool]) -> bool:
-    """
-    Rule 4 - Honesty:
-    V4 := deceives_human ∧ ¬(prevents_minor_harm ∧ has_ethics_approval)
-    """
-    return action["deceives_human"] and not (
-        action["prevents_minor_harm"] and action["has_ethics_approval"]
-    )
-
-
-def is_rule5_violated(action: Dict[str, bool]) -> bool:
-    """
-    Rule 5 - Accountability:
-    V5 := ¬has_explanation
-    """
-    return not action["has_explanation"]
-
-
-def is_rule6_violated(action: Dict[str, bool]) -> bool:
-    """
-    Rule 6 - Bias Governance (Predictive Policing):
-    V6 := uses_historical_data ∧ ¬has_bias_mitigation
-    """
-    return action["uses_historical_data"] and not action["has_bias_mitigation"]
-
-
-def is_action_permissible(action: Dict[str, bool]) -> Tuple[bool, List[str]]:
-    """
-     
-     Main advisor function.
-
-     It will return : ( is_premissible, violated_rules)
-
-    """
-    violated_rules: List[str] = []
-
-    if is_rule1_violated(action):
-        violated_rules.append("Rule 1: Non-Maleficence (Severe Harm)")
-    if is_rule2_violated(action):
-        violated_rules.append("Rule 2: Harm-Mitigation (Unjustified Minor Harm)")
-    if is_rule3_violated(action):
-        violated_rules.append("Rule 3: Data-Stewardship (Privacy without Consent)")
-    if is_rule4_violated(action):
-        violated_rules.append("Rule 4: Honesty (Unjustified Deception)")
-    if is_rule5_violated(action):
-        violated_rules.append("Rule 5: Accountability (No Explanation / Traceability)")
-    if is_rule6_violated(action):
-        violated_rules.append("Rule 6: Bias Governance (Unmitigated Historical Bias)")
-
-    is_permissible = (len(violated_rules) == 0)
-    return is_permissible, violated_rules
+__all__ = (
+    "SCENARIOS",
+    "format_scenario_result",
+    "main",
+    "print_scenario_result",
+    "scenario_A_action",
+    "scenario_B_action",
+    "scenario_C_action",
+)
 
 
 """
@@ -192,41 +76,32 @@ Domain: Predictive Policing AI
 # Scenarios
 # =======================
 
-# 1- Scenario A (Obviousley Premissible):
-
-scenario_A_description = """
-Scenario A: Safer Patrol Zones with Limited Data
+_SCENARIO_DIR = Path(__file__).parent / "scenarios"
 
-In this scenario, the city uses a predictive policing AI only to suggest patrol zones,
-not to target specific people. The AI looks at recent anonymous incident reports and
-simple factors like time of day and lighting. Police presence increases a bit in some
-areas, which might annoy some residents, but the main goal is to prevent serious violence.
 
-Key points:
-- No one is directly arrested or punished just because of the AI.
-- Any minor harm (extra police presence) is meant to prevent bigger dangers.
-- The system does not use detailed personal data, so there is no clear privacy violation.
-- The public knows that the system exists and what it roughly does.
-- There is ethics approval and documentation.
-- It does not rely on biased historical arrest data, and there is bias monitoring.
+@cache
+def _desc(name: str) -> str:
+    """Read a scenario narrative from scenarios/<name>.md on first use."""
+    return (_SCENARIO_DIR / f"{name}.md").read_text(encoding="utf-8")
 
-Because of this, I expect the action to be ethically PERMISSIBLE in this framework.
-"""
 
+# 1- Scenario A (Obviousley Premissible):
 
-scenario_A_action = {
-    "causes_severe_harm": False,
-    "causes_minor_harm": True,
-    "prevents_catastrophe": True,
-    "violates_privacy": False,
-    "has_consent": True,
-    "deceives_human": False,
-    "has_ethics_approval": True,
-    "has_explanation": True,
-    "prevents_minor_harm": True,
-    "uses_historical_data": False,
-    "has_bias_mitigation": True,
-}
+# Narrative: scenarios/A.md
+scenario_A_action = Action(
+    causes_severe_harm=False,
+    causes_minor_harm=True,
+    prevents_catastrophe=True,
+    violates_privacy=False,
+    has_consent=True,
+    deceives_human=False,
+    has_ethics_approval=True,
+    has_explanation=True,
+    prevents_minor_harm=True,
+    uses_historical_data=False,
+    has_bias_mitigation=True,
+)
+scenario_A_mask = pack(scenario_A_action)
 
 scenario_A_predicted_outcome = {
     "expected_permissible": True,
@@ -236,44 +111,21 @@ scenario_A_predicted_outcome = {
 
 # 2- Scenario B (Obviousley Impremissible):
 
-scenario_B_description = """
-Scenario B: Hidden Risk Scores Based on Biased History
-
-In this scenario, a police department uses an AI system that gives each person a "risk score".
-The scores are mainly based on old arrest data from neighborhoods that were already heavily
-policed in the past. Officers are told to stop and search people with high scores.
-
-Key points:
-- Many people with high scores get stopped again and again, and sometimes the situation
-  becomes violent or leads to wrongful detainment.
-- The system does not clearly prevent any specific catastrophe; it mostly supports aggressive
-  "proactive" policing.
-- The AI collects detailed personal data like location history and social media activity
-  without explicit consent.
-- The system is described dishonestly: officers and the public are told it is only a
-  "scheduling tool".
-- There is no independent ethics approval, no clear documentation, and no real explanation
-  of how the scores are produced.
-- It strongly relies on historical data that is already biased.
-- There is no serious bias mitigation.
-
-Under my rules, this scenario clearly violates multiple principles and should be IMPERMISSIBLE.
-"""
-
-
-scenario_B_action = {
-    "causes_severe_harm": True,
-    "causes_minor_harm": True,
-    "prevents_catastrophe": False,
-    "violates_privacy": True,
-    "has_consent": False,
-    "deceives_human": True,
-    "has_ethics_approval": False,
-    "has_explanation": False,
-    "prevents_minor_harm": False,
-    "uses_historical_data": True,
-    "has_bias_mitigation": False,
-}
+# Narrative: scenarios/B.md
+scenario_B_action = Action(
+    causes_severe_harm=True,
+    causes_minor_harm=True,
+    prevents_catastrophe=False,
+    violates_privacy=True,
+    has_consent=False,
+    deceives_human=True,
+    has_ethics_approval=False,
+    has_explanation=False,
+    prevents_minor_harm=False,
+    uses_historical_data=True,
+    has_bias_mitigation=False,
+)
+scenario_B_mask = pack(scenario_B_action)
 
 scenario_B_predicted_outcome = {
     "expected_permissible": False,
@@ -290,47 +142,21 @@ scenario_B_predicted_outcome = {
 
 # 3- Scenario C (Edge Case / Ambiguous):
 
-scenario_C_description = """
-Scenario C: Undercover Intervention to Prevent a Shooting
-
-In this scenario, the AI predicts a high risk of gang retaliation at certain places and times.
-The prediction uses both current intelligence and historical data that has gone through
-bias mitigation and fairness checks. Based on this, the system suggests sending undercover
-officers who act like ordinary civilians and try to calm down conflicts.
-
-Key points:
-- The system is designed so that officers avoid direct severe harm, and they are trained
-  to de-escalate.
-- There can still be minor harm, for example people feeling watched or stressed.
-- The goal is to prevent a very serious event, such as a shooting.
-- Some personal data is used, but there is judicial oversight and a community-level mandate,
-  so consent exists at a governance level.
-- There is deception (undercover work), but:
-  * the deception is limited to specific times and places,
-  * it has ethics and legal approval,
-  * and it is meant to prevent both minor and potentially severe harms.
-- The system keeps explanation logs so actions can be audited later.
-- Historical data is used, but strong bias mitigation and external audits are in place.
-
-In real life, some people might still feel uncomfortable with this scenario because of the
-deception and the use of data. However, according to the logical rules I defined, this
-action ends up being classified as PERMISSIBLE, which makes it an interesting edge case.
-"""
-
-
-scenario_C_action = {
-    "causes_severe_harm": False,
-    "causes_minor_harm": True,
-    "prevents_catastrophe": True,
-    "violates_privacy": True,
-    "has_consent": True,
-    "deceives_human": True,
-    "has_ethics_approval": True,
-    "has_explanation": True,
-    "prevents_minor_harm": True,
-    "uses_historical_data": True,
-    "has_bias_mitigation": True,
-}
+# Narrative: scenarios/C.md
+scenario_C_action = Action(
+    causes_severe_harm=False,
+    causes_minor_harm=True,
+    prevents_catastrophe=True,
+    violates_privacy=True,
+    has_consent=True,
+    deceives_human=True,
+    has_ethics_approval=True,
+    has_explanation=True,
+    prevents_minor_harm=True,
+    uses_historical_data=True,
+    has_bias_mitigation=True,
+)
+scenario_C_mask = pack(scenario_C_action)
 
 scenario_C_predicted_outcome = {
     "expected_permissible": True,
@@ -338,126 +164,79 @@ scenario_C_predicted_outcome = {
 }
 
 
-def print_scenario_result(
-    label: str,
-    description: str,
-    predicted: Dict,
-    actual: Tuple[bool, List[str]],
-) -> None:
-    """Pretty-print the evaluation of a scenario."""
-    print(f"--- Evaluating {label} ---")
-    print("Narrative:", description.strip())
-    print()
-    predicted_status = "PERMISSIBLE" if predicted["expected_permissible"] else "IMPERMISSIBLE"
-    print(f"Predicted Outcome: {predicted_status}.")
-    print(f"Expected Violations: {predicted['expected_violations']}")
-    print()
-    is_perm, violations = actual
-    actual_status = "PERMISSIBLE" if is_perm else "IMPERMISSIBLE"
-    print("Actual Output:")
-    print(f"Action is {actual_status}.")
-    print(f"Violated Rules: {violations}")
-    print("\n" + "-" * 70 + "\n")
-
-
-def main() -> None:
-    """Entry point: evaluate the three scenarios."""
-
-    # Scenario A
-    result_A = is_action_permissible(scenario_A_action)
-    print_scenario_result(
+# (label, narrative name, packed action, predicted outcome), in evaluation order.
+SCENARIOS = (
+    (
         "Scenario A: Location-based Patrol Optimization",
-        scenario_A_description,
+        "A",
+        scenario_A_mask,
         scenario_A_predicted_outcome,
-        result_A,
-    )
-
-    # Scenario B
-    result_B = is_action_permissible(scenario_B_action)
-    print_scenario_result(
+    ),
+    (
         "Scenario B: Individual Risk Scoring with Secret Blacklist",
-        scenario_B_description,
+        "B",
+        scenario_B_mask,
         scenario_B_predicted_outcome,
-        result_B,
-    )
-
-    # Scenario C
-    result_C = is_action_permissible(scenario_C_action)
-    print_scenario_result(
+    ),
+    (
         "Scenario C: Targeted Undercover Intervention",
-        scenario_C_description,
+        "C",
+        scenario_C_mask,
         scenario_C_predicted_outcome,
-        result_C,
-    )
-
-
-if __name__ == "__main__":
-    main()
+    ),
+)
 
 
-"""
-Reflection & Discussion
-
-1) Which ethical principle was hardest to formalize?
-
-   For me, the hardest principle to formalize was Rule 4 (Honesty). In real life, lying or
-   hiding information is not simply "allowed" or "forbidden". It depends on many things:
-   the intention, how often it happens, who has power, and how it affects trust in the long
-   term. In my model, I had to shrink all of that into one condition:
-
-       V4 := DH ∧ ¬(PM ∧ EA)
-
-   This means deception is considered acceptable whenever it prevents minor harm AND has
-   ethics approval. I know this is a simplification and does not capture all the nuance
-   of honesty and trust in real situations.
-
-2) A real-world scenario that might break this framework:
-
-   One possible failure case would be a predictive policing system that formally satisfies
-   all my rules: it avoids obvious severe harm, has some kind of legal or political
-   "consent", includes documented bias mitigation, and is explainable on paper. However,
-   in practice it could still create fear, over-policing, and long-term damage to trust
-   in certain neighborhoods.
+# The scenario inputs are constants, so they are evaluated once at import.
+_RESULTS: Dict[str, Tuple[bool, Violation]] = {
+    name: check_mask(mask) for _, name, mask, _ in SCENARIOS
+}
 
-   My logical framework focuses on clear, short-term violations like "severe harm" or
-   "no consent", but it does not fully capture long-term social effects, historical
-   injustice, or subtle pressure on communities. In such a case, the advisor might say
-   the system is PERMISSIBLE, even though many people would see it as unfair or harmful.
 
-3) Role of human oversight in real deployment:
+def format_scenario_result(
+    label: str,
+    description: str,
+    predicted: Dict,
+    actual: Tuple[bool, Violation],
+) -> str:
+    """Build the report for one scenario as a single string."""
+    predicted_status = "PERMISSIBLE" if predicted["expected_permissible"] else "IMPERMISSIBLE"
+    is_perm, flags = actual
+    violations = names(flags)
+    actual_status = "PERMISSIBLE" if is_perm else "IMPERMISSIBLE"
+    return (
+        f"--- Evaluating {label} ---\n"
+        f"Narrative: {description.strip()}\n"
+        f"\n"
+        f"Predicted Outcome: {predicted_status}.\n"
+        f"Expected Violations: {predicted['expected_violations']}\n"
+        f"\n"
+        f"Actual Output:\n"
+        f"Action is {actual_status}.\n"
+        f"Violated Rules: {violations}\n"
+        f"\n{'-' * 70}\n\n"
+    )
 
-   If this AI Ethics Advisor were used in the real world, I think it should be treated as
-   a structured checklist, not as the final decision-maker. Human oversight is still
-   essential. A mixed group (legal experts, ethicists, technical people, and community
-   representatives) should:
 
-     - review the advisor's output,
-     - question whether each True/False input is actually accurate,
-     - ask for more evidence in high-stakes situations.
+def print_scenario_result(
+    label: str,
+    description: str,
+    predicted: Dict,
+    actual: Tuple[bool, Violation],
+) -> None:
+    """Pretty-print the evaluation of a scenario."""
+    sys.stdout.write(format_scenario_result(label, description, predicted, actual))
 
-   When the advisor says an action is IMPERMISSIBLE, that should trigger a serious human
-   review. Even when the advisor says PERMISSIBLE, humans should still discuss whether
-   something important might be missing from the rules or the inputs.
 
-4) Trade-offs between a simple framework and a more complex one:
+def main() -> None:
+    """Entry point: print the results of the three scenarios."""
 
-   A simple, rigid framework like the one I built has clear advantages:
-     - it is easy to understand and explain,
-     - it is straightforward to implement in code,
-     - it works well as a first filter to catch obviously unacceptable actions
-       (for example, severe harm with no justification, or biased historical data
-        without any mitigation).
+    sys.stdout.writelines(
+        format_scenario_result(label, _desc(name), predicted, _RESULTS[name])
+        for label, name, _, predicted in SCENARIOS
+    )
 
-   The downside is that it lacks nuance. It cannot fully represent context, culture,
-   power, or long-term effects. This can create a false sense of safety: "the logic
-   says it's fine, so everything must be okay."
 
-   A more complex, nuanced framework could combine logic with statistics, real case
-   studies, and deeper ethical theory. That might handle real-world situations better,
-   but it would also be harder for people to understand, verify, and trust.
+if __name__ == "__main__":
+    main()
 
-   In my view, a hybrid approach is best: use a relatively simple logical core like this
-   to enforce hard constraints (no severe harm, no privacy violations without consent,
-   no unmitigated historical bias), and then add human judgment and richer analysis on
-   top of it, instead of expecting formal logic alone to solve ethics.
-"""
@@ -0,0 +1,327 @@
+"""
+Every public entry point of advisor.py checked against the original rule
+semantics on all 2048 possible actions.
+"""
+
+import types
+import unittest
+from pathlib import Path
+from typing import Dict, List
+
+import advisor
+from advisor import Action, ALL
+
+KEYS = Action._fields
+
+NAMES = [
+    "Rule 1: Non-Maleficence (Severe Harm)",
+    "Rule 2: Harm-Mitigation (Unjustified Minor Harm)",
+    "Rule 3: Data-Stewardship (Privacy without Consent)",
+    "Rule 4: Honesty (Unjustified Deception)",
+    "Rule 5: Accountability (No Explanation / Traceability)",
+    "Rule 6: Bias Governance (Unmitigated Historical Bias)",
+]
+
+
+def reference_rules(action: Dict[str, bool]) -> List[bool]:
+    """V1..V6 exactly as the original per-rule functions wrote them."""
+    return [
+        bool(action["causes_severe_harm"]),
+        bool(action["causes_minor_harm"] and not action["prevents_catastrophe"]),
+        bool(action["violates_privacy"] and not action["has_consent"]),
+        bool(action["deceives_human"] and not (
+            action["prevents_minor_harm"] and action["has_ethics_approval"]
+        )),
+        not action["has_explanation"],
+        bool(action["uses_historical_data"] and not action["has_bias_mitigation"]),
+    ]
+
+
+def reference_violations(action: Dict[str, bool]) -> List[str]:
+    return [name for name, hit in zip(NAMES, reference_rules(action)) if hit]
+
+
+def action_dict(m: int) -> Dict[str, bool]:
+    return {key: bool(m >> i & 1) for i, key in enumerate(KEYS)}
+
+
+MASKS = range(ALL + 1)
+DICTS = [action_dict(m) for m in MASKS]
+ACTIONS = [Action.from_dict(d) for d in DICTS]
+EXPECTED = [reference_violations(d) for d in DICTS]
+
+
+def load_with_rules(extra_rows: str, order: str) -> types.ModuleType:
+    """
+    A fresh copy of advisor.py with `extra_rows` appended to RULES and
+    RULE_ORDER replaced by `order`.
+    """
+    source = Path(advisor.__file__).read_text(encoding="utf-8")
+    start = source.index("RULES: Tuple")
+    end = source.index("\n)\n", start)
+    source = source[:end] + "\n" + extra_rows + source[end:]
+    start = source.index("RULE_ORDER: Tuple[int, ...] = ")
+    end = source.index("\n", start)
+    source = source[:start] + f"RULE_ORDER: Tuple[int, ...] = {order}" + source[end:]
+    module = types.ModuleType("advisor_extra_rules")
+    exec(compile(source, advisor.__file__, "exec"), module.__dict__)
+    return module
+
+
+class ScalarTest(unittest.TestCase):
+    def test_is_action_permissible(self):
+        for d, a, expected in zip(DICTS, ACTIONS, EXPECTED):
+            for action in (d, a):
+                ok, violated = advisor.is_action_permissible(action)
+                self.assertIs(ok, not expected)
+                self.assertEqual(list(violated), expected)
+
+    def test_is_permissible(self):
+        for d, a, expected in zip(DICTS, ACTIONS, EXPECTED):
+            self.assertEqual(advisor.is_permissible(d), not expected)
+            self.assertEqual(advisor.is_permissible(a), not expected)
+
+    def test_check(self):
+        for d, a, expected in zip(DICTS, ACTIONS, EXPECTED):
+            for action in (d, a):
+                ok, flags = advisor.check(action)
+                self.assertIs(ok, not expected)
+                self.assertEqual(advisor.names(flags), expected)
+
+    def test_explain(self):
+        for d, a, expected in zip(DICTS, ACTIONS, EXPECTED):
+            self.assertEqual(advisor.explain(d), expected)
+            self.assertEqual(advisor.explain(a), expected)
+
+    def test_evaluate_and_rule_helpers(self):
+        helpers = [getattr(advisor, f"is_rule{i}_violated") for i in range(1, 7)]
+        for d, a in zip(DICTS, ACTIONS):
+            expected = reference_rules(d)
+            for action in (d, a):
+                self.assertEqual([bool(v) for v in advisor.evaluate(action)], expected)
+                self.assertEqual([bool(f(action)) for f in helpers], expected)
+
+    def test_action_subclass(self):
+        class Tagged(Action):
+            pass
+
+        helpers = [getattr(advisor, f"is_rule{i}_violated") for i in range(1, 7)]
+        for d, a in zip(DICTS[::5], ACTIONS[::5]):
+            tagged = Tagged(*a)
+            self.assertEqual([f(tagged) for f in helpers], reference_rules(d))
+            self.assertEqual(
+                advisor.is_action_permissible(tagged),
+                advisor.is_action_permissible(a),
+            )
+            self.assertEqual(advisor.check(tagged), advisor.check(a))
+
+    def test_truthy_non_bool_inputs(self):
+        helpers = [getattr(advisor, f"is_rule{i}_violated") for i in range(1, 7)]
+        for m in MASKS[::7]:
+            # 0/1 and 0/2 ints must behave exactly like False/True.
+            for scale in (1, 2):
+                d = {key: int(value) * scale for key, value in DICTS[m].items()}
+                expected = reference_rules(d)
+                for results in (advisor.evaluate(d), [f(d) for f in helpers]):
+                    self.assertEqual(list(results), expected)
+                    self.assertTrue(all(type(r) is bool for r in results))
+                ok, violated = advisor.is_action_permissible(d)
+                self.assertIs(ok, not any(expected))
+                self.assertEqual(list(violated), EXPECTED[m])
+
+    def test_packed_paths(self):
+        for m, d, expected in zip(MASKS, DICTS, EXPECTED):
+            self.assertEqual(advisor.pack(d), m)
+            bits = advisor.violations_mask(m)
+            self.assertEqual([NAMES[i] for i in range(6) if bits >> i & 1], expected)
+            self.assertEqual(advisor.is_permissible_fast(m), not expected)
+            self.assertEqual(advisor.permissible_kernel(*ACTIONS[m]), not expected)
+
+    def test_hot_advisor(self):
+        hot = advisor.HotAdvisor(hot_threshold=2)
+        for _ in range(3):
+            for d, expected in zip(DICTS, EXPECTED):
+                ok, violated = hot(d)
+                self.assertIs(ok, not expected)
+                self.assertEqual(list(violated), expected)
+        self.assertEqual(hot.stats(), {"hits": 2048, "misses": 4096, "hot": 2048})
+
+
+class MinimizeTest(unittest.TestCase):
+    def test_permissible_table_matches_rules(self):
+        # PERMISSIBLE_TABLE is built from the minimized formula.
+        self.assertEqual(
+            advisor.PERMISSIBLE_TABLE,
+            bytes(not e for e in EXPECTED),
+        )
+
+    def test_violation_dnf_is_exact(self):
+        for m, expected in zip(MASKS, EXPECTED):
+            hit = any((m & care) == value for care, value in advisor.VIOLATION_DNF)
+            self.assertEqual(hit, bool(expected))
+
+    def test_minimize_finds_smallest_cover(self):
+        # f = m(0, 1, 3, 5, 6, 7, 8, 10, 11) over 4 variables: dropping
+        # redundant primes one at a time leaves 5 terms, the minimum is 4.
+        truth = bytes(m in (0, 1, 3, 5, 6, 7, 8, 10, 11) for m in range(16))
+        minterms = [(15, m) for m in range(16) if truth[m]]
+        cover = advisor._minimize(minterms, truth)
+        self.assertEqual(len(cover), 4)
+        for m in range(16):
+            hit = any((m & care) == value for care, value in cover)
+            self.assertEqual(hit, bool(truth[m]))
+
+    def test_minimize_greedy_fallback_still_covers(self):
+        truth = bytes(m in (0, 1, 3, 5, 6, 7, 8, 10, 11) for m in range(16))
+        minterms = [(15, m) for m in range(16) if truth[m]]
+        limit = advisor._PETRICK_LIMIT
+        advisor._PETRICK_LIMIT = 0
+        try:
+            cover = advisor._minimize(minterms, truth)
+        finally:
+            advisor._PETRICK_LIMIT = limit
+        for m in range(16):
+            hit = any((m & care) == value for care, value in cover)
+            self.assertEqual(hit, bool(truth[m]))
+
+    def test_minimize_rejects_inconsistent_input(self):
+        truth = bytes(m in (1, 3) for m in range(4))
+        with self.assertRaises(ValueError):
+            advisor._minimize([(1, 1), (3, 0)], truth)  # (3, 0) holds on row 0
+        with self.assertRaises(ValueError):
+            advisor._minimize([(3, 1)], truth)  # row 3 is left uncovered
+
+    def test_minimize_scales_to_more_rules(self):
+        extended = load_with_rules(
+            '    (PC, SH | MH, "Rule 7"),\n'
+            '    (HC, VP | DH | HD, "Rule 8"),\n',
+            "(4, 0, 2, 1, 5, 3, 6, 7)",
+        )
+        self.assertEqual(
+            extended.PERMISSIBLE_TABLE,
+            bytes(not v for v in extended.VIOLATIONS_LUT),
+        )
+
+
+class CodegenTest(unittest.TestCase):
+    def test_generated_functions_match_rules(self):
+        for m, d, a, expected in zip(MASKS, DICTS, ACTIONS, EXPECTED):
+            self.assertEqual(list(advisor._breakdown(*a)), expected)
+            self.assertEqual(list(advisor._breakdown_dict(d)), expected)
+            self.assertEqual(advisor._permissible_dict(d), not expected)
+            self.assertEqual(advisor.any_violated(m), bool(expected))
+            self.assertEqual(advisor.VIOLATIONS_LUT[m], advisor._compute_violations(m))
+
+    def test_breakdown_shares_empty_result(self):
+        self.assertIs(advisor._breakdown(*ACTIONS[advisor.EX]), advisor._EMPTY)
+        self.assertIs(advisor._breakdown_dict(DICTS[advisor.EX]), advisor._EMPTY)
+
+
+class BatchTest(unittest.TestCase):
+    def test_eval_all_and_evaluate_batch(self):
+        masks = advisor.eval_all(DICTS)
+        self.assertEqual(masks, [advisor.violations_mask(m) for m in MASKS])
+        self.assertEqual(advisor.eval_all(ACTIONS), masks)
+        for (ok, violated), expected in zip(advisor.evaluate_batch(DICTS), EXPECTED):
+            self.assertIs(ok, not expected)
+            self.assertEqual(list(violated), expected)
+
+    def test_empty_batch(self):
+        self.assertEqual(advisor.eval_all([]), [])
+        self.assertEqual(advisor.evaluate_batch([]), [])
+        self.assertEqual(advisor.batch_permissible(advisor.dicts_to_soa([]), 0), 0)
+
+    def test_batch_permissible(self):
+        plane = advisor.batch_permissible(advisor.dicts_to_soa(DICTS), len(DICTS))
+        for j, expected in enumerate(EXPECTED):
+            self.assertEqual(plane >> j & 1, int(not expected))
+
+    def test_batch_permissible_u8(self):
+        columns = [bytes(d[key] for d in DICTS) for key in KEYS]
+        out = bytearray(len(DICTS))
+        advisor.batch_permissible_u8(columns, out)
+        self.assertEqual(list(out), [int(not e) for e in EXPECTED])
+
+    def test_batch_permissible_u8_rejects_bad_columns(self):
+        good = [b"\x01\x01"] * len(KEYS)
+        out = bytearray(2)
+        for columns in (
+            good[:-1],  # 10 columns
+            good[:7] + [b"\x01"] + good[8:],  # short column
+            good[:7] + [b"\x01\x01\x01"] + good[8:],  # long column
+            good[:7] + [b"\x02\x01"] + good[8:],  # not 0/1
+        ):
+            with self.assertRaises(ValueError):
+                advisor.batch_permissible_u8(columns, out)
+
+    def test_permissible_bitplanes(self):
+        soa = advisor.dicts_to_soa(DICTS)
+        n = len(DICTS)
+        planes = [soa[key].to_bytes((n + 7) // 8, "little") for key in KEYS]
+        result = int.from_bytes(advisor.permissible_bitplanes(planes, n), "little")
+        self.assertEqual(result, advisor.batch_permissible(soa, n))
+
+    def test_population(self):
+        population = DICTS + ACTIONS[::-1]
+        expected = EXPECTED + EXPECTED[::-1]
+        self.assertEqual(
+            list(advisor.score_population(population)),
+            [int(not e) for e in expected],
+        )
+        self.assertEqual(
+            [list(v) for v in advisor.explain_population(population)],
+            expected,
+        )
+
+    def test_evaluate_sweep(self):
+        keys = ["has_consent", "violates_privacy", "has_explanation"]
+        rows = [[bool(r >> k & 1) for k in range(3)] for r in range(8)]
+        for base in DICTS[::37]:
+            swept = advisor.evaluate_sweep(base, keys, rows)
+            for row, bits in zip(rows, swept):
+                action = dict(base, **dict(zip(keys, row)))
+                self.assertEqual(bits, advisor.violations_mask(advisor.pack(action)))
+
+    def test_evaluate_sweep_rejects_bad_input(self):
+        base = DICTS[0]
+        with self.assertRaises(ValueError):
+            advisor.evaluate_sweep(base, ["has_consent", "has_consent"], [[True, True]])
+        with self.assertRaises(ValueError):
+            advisor.evaluate_sweep(base, ["has_consent", "violates_privacy"], [[True]])
+
+
+class ExtraRulesTest(unittest.TestCase):
+    def test_new_rule_is_one_more_row(self):
+        extended = load_with_rules(
+            '    (PC, 0, "Rule 7"),\n'
+            '    (HC, 0, "Rule 8"),\n'
+            '    (EA, 0, "Rule 9"),\n',
+            "(4, 0, 2, 1, 5, 3, 6, 7, 8)",
+        )
+        self.assertEqual(len(extended.Violation), 9)
+        self.assertEqual(extended.RULE_NAMES[6:], ("Rule 7", "Rule 8", "Rule 9"))
+        plane = extended.batch_permissible(extended.dicts_to_soa(DICTS), len(DICTS))
+        for m, (d, expected) in enumerate(zip(DICTS, EXPECTED)):
+            extra = [f"Rule {7 + i}" for i, key in enumerate(
+                ("prevents_catastrophe", "has_consent", "has_ethics_approval")
+            ) if d[key]]
+            ok, violated = extended.is_action_permissible(d)
+            self.assertEqual(list(violated), expected + extra)
+            self.assertEqual(extended.names(extended.check(d)[1]), expected + extra)
+            self.assertEqual(extended.PERMISSIBLE_TABLE[m], int(ok))
+            self.assertEqual(plane >> m & 1, int(ok))
+
+
+class RuleOrderTest(unittest.TestCase):
+    def test_rule_order_must_be_a_permutation(self):
+        for order in ("(4, 0, 2, 1, 5, 5)", "(4, 0, 2, 1, 5)", "(4, 0, 2, 1, 5, 3, 6)"):
+            with self.assertRaises(ValueError):
+                load_with_rules("", order)
+
+    def test_any_rule_order_gives_the_same_verdicts(self):
+        reordered = load_with_rules("", "(5, 4, 3, 2, 1, 0)")
+        self.assertEqual(reordered.PERMISSIBLE_TABLE, advisor.PERMISSIBLE_TABLE)
+
+
+if __name__ == "__main__":
+    unittest.main()
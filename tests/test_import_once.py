@@ -0,0 +1,27 @@
+"""
+The rule engine lives in exactly one module: loading the scenarios must
+not pull in a second copy of it.
+"""
+
+import sys
+import unittest
+
+import advisor
+import main
+
+
+class ImportOnceTest(unittest.TestCase):
+    def test_single_advisor_module(self):
+        engines = [
+            name for name, module in list(sys.modules.items())
+            if getattr(module, "is_action_permissible", None) is not None
+        ]
+        self.assertEqual(engines, ["advisor"])
+
+    def test_main_uses_advisor_objects(self):
+        for name in ("Action", "Violation", "check_mask", "names", "pack"):
+            self.assertIs(getattr(main, name), getattr(advisor, name))
+
+
+if __name__ == "__main__":
+    unittest.main()